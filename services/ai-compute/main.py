@@ -3,32 +3,170 @@ AI Compute Service - FastAPI for ML workloads
 Gulhaji Plaza Laptop Recommendation System
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from decimal import Decimal
+import orjson
+import os
+import threading
 import pandas as pd
 import numpy as np
 
 from preprocessing.normalizer import MinMaxNormalizer
-from preprocessing.data_loader import load_hardware_specs
+from preprocessing.data_loader import (
+    load_hardware_specs,
+    load_hardware_specs_with_source,
+    build_feature_matrix,
+    get_numeric_columns
+)
+from preprocessing._kernels import warm_up as warm_up_kernels, weighted_sum
+
+def _json_default(obj: Any) -> Any:
+    """Encode pandas/database values that orjson doesn't handle natively"""
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class SpecsJSONResponse(ORJSONResponse):
+    """
+    orjson-encoded response for spec records.
+
+    Returning it directly from an endpoint skips FastAPI's jsonable_encoder
+    pass; NumPy scalars and arrays are serialized natively and NaN becomes null.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
 
 app = FastAPI(
     title="AI Compute Service",
     description="ML/AI computation service for laptop recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=SpecsJSONResponse
 )
 
-# CORS for frontend access
+# CORS for frontend access; CORS_ORIGIN takes a comma-separated list of origins
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGIN", "http://localhost:5173,http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=600,
 )
 
 
+@app.on_event("startup")
+def compile_kernels():
+    """Compile scoring kernels once at startup instead of on the first request"""
+    warm_up_kernels()
+
+
+# Retry policy for refitting the normalizer when the database was
+# unreachable at startup
+NORMALIZER_REFIT_INTERVAL_S = 30.0
+NORMALIZER_REFIT_ATTEMPTS = 20
+
+# Set on shutdown to stop the background refit thread
+_refit_stop = threading.Event()
+
+
+def _fit_normalizer() -> bool:
+    """
+    Fit the shared normalizer and store it in app state.
+
+    Parameters are persisted to SCALING_PARAMS_PATH only when fitted on
+    database specs.
+
+    Returns:
+        bool: True if the fit is final, False if the database query failed
+              and a later refit may pick up real specs
+    """
+    df, source = load_hardware_specs_with_source()
+    app.state.normalizer = MinMaxNormalizer(numeric_columns=get_numeric_columns()).fit(df)
+
+    if source == "database":
+        params_path = os.getenv("SCALING_PARAMS_PATH")
+        if params_path:
+            app.state.normalizer.save(params_path)
+        return True
+
+    if source == "sample":
+        print("No usable database for hardware specs, scaling params fitted on sample data")
+        return True
+
+    return False
+
+
+def _retry_normalizer_fit() -> None:
+    """Refit in the background until the database answers or retries run out."""
+    for _ in range(NORMALIZER_REFIT_ATTEMPTS):
+        if _refit_stop.wait(NORMALIZER_REFIT_INTERVAL_S):
+            return
+        if _fit_normalizer():
+            return
+
+    print("Database still unreachable, keeping scaling params fitted on sample data")
+
+
+@app.on_event("startup")
+def load_normalizer():
+    """
+    Fit the shared normalizer once at startup and freeze it in app state.
+    If SCALING_PARAMS_PATH is set, parameters are reused from that file
+    across restarts (delete it to refit on current specs).
+
+    If the database is unreachable, a provisional sample-data fit is used
+    and refits are retried in a background thread, off the request path.
+    """
+    params_path = os.getenv("SCALING_PARAMS_PATH")
+
+    if params_path and os.path.exists(params_path):
+        try:
+            app.state.normalizer = MinMaxNormalizer.load(
+                params_path, numeric_columns=get_numeric_columns()
+            )
+            return
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"Could not load scaling params from {params_path}: {e}, refitting")
+
+    if not _fit_normalizer():
+        _refit_stop.clear()
+        threading.Thread(target=_retry_normalizer_fit, daemon=True).start()
+
+
+@app.on_event("shutdown")
+def stop_normalizer_refit():
+    """Stop any pending background refit"""
+    _refit_stop.set()
+
+
+def get_normalizer(request: Request) -> MinMaxNormalizer:
+    """Dependency returning the shared normalizer fitted at startup"""
+    return request.app.state.normalizer
+
+
 class NormalizationRequest(BaseModel):
     """Request model for normalization endpoint"""
     spec_ids: Optional[List[str]] = None
@@ -59,48 +197,59 @@ async def health_check():
 
 
 @app.post("/api/v1/normalize")
-async def normalize_specs(request: NormalizationRequest):
+def normalize_specs(
+    request: NormalizationRequest,
+    normalizer: MinMaxNormalizer = Depends(get_normalizer)
+):
     """
     Normalize hardware specifications using Min-Max Normalization.
     Scales all numeric features between 0 and 1.
+
+    Declared as a plain function so FastAPI runs the blocking database
+    read and pandas work in its threadpool, off the event loop.
     """
     try:
-        # Load hardware specs from database or sample data
-        df = load_hardware_specs()
-
-        if df.empty:
-            raise HTTPException(status_code=404, detail="No hardware specs found")
-
-        # Initialize normalizer
-        normalizer = MinMaxNormalizer()
-
         # Select features to normalize - only numeric columns
         features = request.features if request.features else None
         if features is None:
             # Use predefined numeric feature columns
             from preprocessing.data_loader import get_feature_columns
             features = get_feature_columns()
-        
+
+        # Load hardware specs from database or sample data, building only
+        # the derived scores the requested features need
+        df = load_hardware_specs(features=features)
+
+        if df.empty:
+            raise HTTPException(status_code=404, detail="No hardware specs found")
+
         # Filter to only columns that exist in dataframe
         available_features = [f for f in features if f in df.columns]
         
-        normalized_df, scaling_params = normalizer.fit_transform(df, available_features)
+        normalized_df = normalizer.transform(df, available_features)
+        scaling_params = normalizer.get_scaling_params(available_features)
+        scaling_params["features_normalized"] = list(scaling_params["min_values"])
 
-        return {
+        return SpecsJSONResponse({
             "success": True,
             "normalized_data": normalized_df.to_dict(orient="records"),
             "scaling_parameters": scaling_params,
             "record_count": len(normalized_df)
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/v1/recommend")
-async def get_recommendations(request: RecommendationRequest):
+def get_recommendations(
+    request: RecommendationRequest,
+    normalizer: MinMaxNormalizer = Depends(get_normalizer)
+):
     """
     Generate laptop recommendations based on user preferences.
     Uses normalized specs for similarity scoring.
+
+    Runs in FastAPI's threadpool (see normalize_specs).
     """
     try:
         # Load and normalize data
@@ -109,45 +258,61 @@ async def get_recommendations(request: RecommendationRequest):
         if df.empty:
             raise HTTPException(status_code=404, detail="No hardware specs found")
         
-        normalizer = MinMaxNormalizer()
-        normalized_df, _ = normalizer.fit_transform(df)
-        
+        # Score on the dense feature matrix; the DataFrame is only
+        # needed again for the winning rows
+        features, spec_ids, columns = build_feature_matrix(df)
+        normalized = normalizer.transform_array(features, columns)
+
         # Calculate relevance scores based on preferences
         scores = calculate_relevance_scores(
-            normalized_df, 
+            normalized,
+            columns,
             request.user_preferences
         )
         
-        # Get top-k recommendations
-        top_indices = np.argsort(scores)[-request.top_k:][::-1]
+        # Get top-k recommendations: partition out the k best, then sort only those
+        k = max(0, min(request.top_k, len(scores)))
+        if k:
+            idx = np.argpartition(scores, -k)[-k:]
+            top_indices = idx[np.argsort(scores[idx])[::-1]]
+        else:
+            top_indices = np.array([], dtype=np.intp)
         
-        recommendations = []
-        for idx in top_indices:
-            recommendations.append({
-                "spec_id": df.iloc[idx]["spec_id"] if "spec_id" in df.columns else str(idx),
+        # Normalize and materialize only the winning rows
+        rows = normalizer.transform(df.iloc[top_indices]).to_dict(orient="records")
+
+        recommendations = [
+            {
+                "spec_id": spec_id,
                 "relevance_score": float(scores[idx]),
-                "laptop_info": normalized_df.iloc[idx].to_dict()
-            })
+                "laptop_info": row
+            }
+            for idx, spec_id, row in zip(top_indices, spec_ids[top_indices].tolist(), rows)
+        ]
         
-        return {
+        return SpecsJSONResponse({
             "success": True,
             "recommendations": recommendations,
             "user_preferences": request.user_preferences
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def calculate_relevance_scores(
-    normalized_df: pd.DataFrame, 
+    normalized: np.ndarray,
+    columns: List[str],
     preferences: Dict[str, Any]
 ) -> np.ndarray:
     """
     Calculate relevance scores based on user preferences.
     Uses weighted Euclidean distance in normalized space.
+
+    Args:
+        normalized: Normalized feature matrix of shape (n_laptops, n_features)
+        columns: Feature name of each matrix column
+        preferences: User preferences from the request
     """
-    scores = np.zeros(len(normalized_df))
-    
     # Default weights for different features
     weights = {
         "ram_gb": 0.15,
@@ -160,15 +325,17 @@ def calculate_relevance_scores(
         "connectivity": 0.10
     }
     
-    # Calculate score for each laptop
-    for idx in range(len(normalized_df)):
-        score = 0.0
-        for feature, weight in weights.items():
-            if feature in normalized_df.columns:
-                score += normalized_df.iloc[idx][feature] * weight
-        scores[idx] = score
-    
-    return scores
+    # Only weight features present in the matrix
+    col_index = {c: i for i, c in enumerate(columns)}
+    w_keys = [k for k in weights if k in col_index]
+    if not w_keys:
+        return np.zeros(len(normalized))
+
+    w_vec = np.array([weights[k] for k in w_keys], dtype=np.float32)
+    mat = np.ascontiguousarray(normalized[:, [col_index[k] for k in w_keys]], dtype=np.float32)
+
+    # Single weighted sum over all laptops (compiled kernel)
+    return weighted_sum(mat, w_vec)
 
 
 if __name__ == "__main__":
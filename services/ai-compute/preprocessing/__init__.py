@@ -4,10 +4,15 @@ Contains data loading and normalization utilities
 """
 
 from .normalizer import MinMaxNormalizer
-from .data_loader import load_hardware_specs, load_sample_data
+from .data_loader import (
+    load_hardware_specs,
+    load_sample_data,
+    preprocess_hardware_specs_async
+)
 
 __all__ = [
     "MinMaxNormalizer",
     "load_hardware_specs",
-    "load_sample_data"
+    "load_sample_data",
+    "preprocess_hardware_specs_async"
 ]
@@ -0,0 +1,59 @@
+"""
+Compiled Numeric Kernels for Recommendation Scoring
+Gulhaji Plaza Laptop Recommendation System
+
+Hot-path kernels are JIT-compiled with Numba when it is installed.
+Without Numba, equivalent NumPy implementations are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the parallel workqueue layer can hang interpreter
+    # shutdown when first launched from a non-main (threadpool) thread.
+    # Multi-core scaling comes from uvicorn workers instead.
+    @njit(fastmath=True, cache=True)
+    def weighted_sum(mat: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """
+        Compute the weighted sum of each row of a feature matrix.
+
+        Args:
+            mat: C-contiguous float32 array of shape (n_samples, n_features)
+            w: float32 weight vector of length n_features
+
+        Returns:
+            np.ndarray: float32 array of n_samples row scores
+        """
+        n = mat.shape[0]
+        out = np.empty(n, np.float32)
+        for i in range(n):
+            s = np.float32(0)
+            for j in range(mat.shape[1]):
+                s += mat[i, j] * w[j]
+            out[i] = s
+        return out
+else:
+    def weighted_sum(mat: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """
+        Compute the weighted sum of each row of a feature matrix.
+
+        Args:
+            mat: float32 array of shape (n_samples, n_features)
+            w: float32 weight vector of length n_features
+
+        Returns:
+            np.ndarray: float32 array of n_samples row scores
+        """
+        return mat @ w
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation so the first request doesn't pay for it."""
+    weighted_sum(np.zeros((1, 1), dtype=np.float32), np.zeros(1, dtype=np.float32))
@@ -8,25 +8,58 @@ or sample data for development/testing.
 
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
+import asyncio
+import functools
 import os
 from datetime import datetime
 
+from .normalizer import GPU_TYPE_SCORES, PANEL_TYPE_SCORES
+
 
 def load_hardware_specs(
     connection_string: Optional[str] = None,
-    spec_ids: Optional[List[str]] = None
+    spec_ids: Optional[List[str]] = None,
+    features: Optional[List[str]] = None
 ) -> pd.DataFrame:
     """
     Load hardware specifications from PostgreSQL database.
 
+    See load_hardware_specs_with_source for arguments; this variant drops
+    the source indicator.
+
+    Returns:
+        pd.DataFrame: Hardware specifications data
+
+    Note:
+        If database connection fails, returns sample data for development.
+    """
+    df, _ = load_hardware_specs_with_source(connection_string, spec_ids, features)
+    return df
+
+
+def load_hardware_specs_with_source(
+    connection_string: Optional[str] = None,
+    spec_ids: Optional[List[str]] = None,
+    features: Optional[List[str]] = None
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Load hardware specifications and report where they came from.
+
     Args:
         connection_string: PostgreSQL connection URL.
                           Falls back to DATABASE_URL env var.
         spec_ids: Optional list of spec IDs to filter
+        features: Optional list of features the caller needs; only the
+                  derived scores among them are computed (all if None)
 
     Returns:
-        pd.DataFrame: Hardware specifications data
+        Tuple containing:
+            - Hardware specifications data
+            - Data source: "database" if read from PostgreSQL; "fallback"
+              if the database query failed (possibly transient); "sample"
+              if no database is configured, the driver isn't installed or
+              the table is empty
 
     Note:
         If database connection fails, returns sample data for development.
@@ -52,123 +85,175 @@ def load_hardware_specs(
                 df = pd.read_sql_query(query, engine)
 
             if not df.empty:
-                return preprocess_hardware_specs(df)
+                return preprocess_hardware_specs(df, features), "database"
     
     except ImportError:
         print("psycopg2 or sqlalchemy not installed, using sample data")
     except Exception as e:
         print(f"Database connection failed: {e}, using sample data")
+        return load_sample_data(spec_ids, features), "fallback"
     
     # Fallback to sample data
-    return load_sample_data(spec_ids)
+    return load_sample_data(spec_ids, features), "sample"
 
 
-def load_sample_data(spec_ids: Optional[List[str]] = None) -> pd.DataFrame:
+def load_sample_data(
+    spec_ids: Optional[List[str]] = None,
+    features: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Generate sample hardware specifications for development/testing.
+
+    The sample data is deterministic, so the preprocessed result is cached
+    per spec_ids/features selection and a copy is returned to each caller.
     
     Args:
         spec_ids: Optional list of spec IDs to include
+        features: Optional list of features needed (see preprocess_hardware_specs)
     
     Returns:
         pd.DataFrame: Sample hardware specifications
     """
-    np.random.seed(42)  # Reproducibility
+    spec_ids_key = tuple(sorted(set(spec_ids))) if spec_ids else None
+    derived_key = (
+        tuple(sorted(set(features) & DERIVED_FEATURES.keys()))
+        if features is not None else None
+    )
+    return _load_sample_data_cached(spec_ids_key, derived_key).copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_sample_data_cached(
+    spec_ids_key: Optional[Tuple[str, ...]],
+    derived_key: Optional[Tuple[str, ...]]
+) -> pd.DataFrame:
+    """Build and preprocess the sample data; callers must not mutate the result."""
+    rng = np.random.default_rng(42)  # Reproducibility
     
     n_samples = 50
-    
+
+    # Draw every random column in a single batch, then map each column of
+    # uniforms onto its distribution
+    u = rng.random((n_samples, len(_SAMPLE_COLUMNS)))
+
     # Generate sample data
-    sample_data = {
-        "spec_id": [f"spec-{i:04d}" for i in range(n_samples)],
-        
-        # Processor
-        "processor_brand": np.random.choice(
-            ["Intel", "AMD", "Apple"], n_samples, 
-            p=[0.5, 0.4, 0.1]
-        ),
-        "processor_model": np.random.choice(
-            ["Core i5", "Core i7", "Core i9", "Ryzen 5", "Ryzen 7", "Ryzen 9", "M1", "M2"],
-            n_samples
-        ),
-        "processor_cores": np.random.choice([4, 6, 8, 10, 12, 16], n_samples),
-        "processor_threads": np.random.choice([8, 12, 16, 20, 24, 32], n_samples),
-        "processor_base_clock_ghz": np.round(np.random.uniform(2.0, 4.0, n_samples), 2),
-        "processor_boost_clock_ghz": np.round(np.random.uniform(4.0, 5.5, n_samples), 2),
-        
-        # Memory
-        "ram_gb": np.random.choice([8, 16, 32, 64], n_samples, p=[0.2, 0.4, 0.3, 0.1]),
-        "ram_type": np.random.choice(["DDR4", "DDR5", "LPDDR4X", "LPDDR5"], n_samples),
-        "ram_slots": np.random.choice([2, 4], n_samples),
-        "max_ram_gb": np.random.choice([32, 64, 128], n_samples),
-        
-        # Storage
-        "storage_type": np.random.choice(
-            ["NVMe SSD", "SATA SSD", "HDD", "NVMe SSD + HDD"], n_samples,
-            p=[0.5, 0.2, 0.1, 0.2]
-        ),
-        "storage_capacity_gb": np.random.choice(
-            [256, 512, 1024, 2048], n_samples,
-            p=[0.2, 0.4, 0.3, 0.1]
-        ),
-        "additional_storage_slots": np.random.choice([0, 1, 2], n_samples, p=[0.3, 0.5, 0.2]),
-        
-        # Display
-        "display_size_inches": np.round(np.random.choice(
-            [13.3, 14.0, 15.6, 16.0, 17.3], n_samples
-        ), 1),
-        "display_resolution": np.random.choice(
-            ["1920x1080", "2560x1440", "3840x2160"], n_samples,
-            p=[0.6, 0.3, 0.1]
-        ),
-        "display_type": np.random.choice(
-            ["IPS", "OLED", "TN", "VA"], n_samples,
-            p=[0.5, 0.2, 0.2, 0.1]
-        ),
-        "refresh_rate_hz": np.random.choice([60, 90, 120, 144, 165, 240], n_samples),
-        "touch_screen": np.random.choice([True, False], n_samples, p=[0.2, 0.8]),
-        
-        # Graphics
-        "gpu_type": np.random.choice(
-            ["Integrated", "Dedicated", "Hybrid"], n_samples,
-            p=[0.3, 0.5, 0.2]
-        ),
-        "gpu_brand": np.random.choice(
-            ["NVIDIA", "AMD", "Intel", None], n_samples,
-            p=[0.4, 0.3, 0.2, 0.1]
-        ),
-        "gpu_model": np.random.choice(
-            ["RTX 4050", "RTX 4060", "RTX 4070", "RTX 4080", "RX 7600M", "RX 7700S", None],
-            n_samples
-        ),
-        "vram_gb": np.random.choice([0, 4, 6, 8, 12, 16], n_samples),
-        
-        # Physical
-        "weight_kg": np.round(np.random.uniform(1.2, 3.5, n_samples), 2),
-        "thickness_mm": np.round(np.random.uniform(15, 25, n_samples), 2),
-        "battery_whr": np.random.choice([50, 60, 70, 80, 90, 99], n_samples),
-        
-        # Connectivity
-        "has_wifi_6": np.random.choice([True, False], n_samples, p=[0.8, 0.2]),
-        "has_bluetooth": np.random.choice([True, False], n_samples, p=[0.9, 0.1]),
-        "usb_c_ports": np.random.choice([0, 1, 2, 3, 4], n_samples),
-        "usb_a_ports": np.random.choice([0, 1, 2, 3, 4], n_samples),
-        "hdmi_ports": np.random.choice([0, 1, 2], n_samples),
-        
-        # Metadata
-        "spec_version": 1,
-        "created_at": datetime.now()
-    }
+    sample_data = {"spec_id": [f"spec-{i:04d}" for i in range(n_samples)]}
+    for (name, sample), u_col in zip(_SAMPLE_COLUMNS, u.T):
+        sample_data[name] = sample(u_col)
+
+    # Metadata
+    sample_data["spec_version"] = 1
+    sample_data["created_at"] = datetime.now()
     
     df = pd.DataFrame(sample_data)
     
     # Filter by spec_ids if provided
-    if spec_ids:
-        df = df[df["spec_id"].isin(spec_ids)]
+    if spec_ids_key:
+        df = df[df["spec_id"].isin(spec_ids_key)]
     
-    return preprocess_hardware_specs(df)
+    return preprocess_hardware_specs(
+        df, list(derived_key) if derived_key is not None else None
+    )
+
+
+def _sample_choice(
+    u: np.ndarray,
+    options: List[Any],
+    p: Optional[List[float]] = None
+) -> np.ndarray:
+    """
+    Map uniform [0, 1) draws onto options, like np.random.choice.
 
+    Args:
+        u: Uniform random draws, one per sample
+        options: Values to choose from
+        p: Optional probabilities for each option (uniform if None)
 
-def preprocess_hardware_specs(df: pd.DataFrame) -> pd.DataFrame:
+    Returns:
+        np.ndarray: Chosen option for each draw
+    """
+    options = np.asarray(options)
+    if p is None:
+        cdf = np.arange(1, len(options) + 1) / len(options)
+    else:
+        cdf = np.cumsum(p)
+    idx = np.searchsorted(cdf, u, side="right")
+    return options[np.minimum(idx, len(options) - 1)]
+
+
+def _choice(options: List[Any], p: Optional[List[float]] = None) -> Callable[[np.ndarray], np.ndarray]:
+    """Sample column spec: choose from options (see _sample_choice)."""
+    return lambda u: _sample_choice(u, options, p)
+
+
+def _uniform(low: float, high: float, decimals: int = 2) -> Callable[[np.ndarray], np.ndarray]:
+    """Sample column spec: uniform in [low, high), rounded to decimals."""
+    return lambda u: np.round(low + (high - low) * u, decimals)
+
+
+# Random sample data columns in generation order; each spec maps one column
+# of uniform draws onto its distribution
+_SAMPLE_COLUMNS: List[Tuple[str, Callable[[np.ndarray], np.ndarray]]] = [
+    # Processor
+    ("processor_brand", _choice(["Intel", "AMD", "Apple"], p=[0.5, 0.4, 0.1])),
+    ("processor_model", _choice(
+        ["Core i5", "Core i7", "Core i9", "Ryzen 5", "Ryzen 7", "Ryzen 9", "M1", "M2"]
+    )),
+    ("processor_cores", _choice([4, 6, 8, 10, 12, 16])),
+    ("processor_threads", _choice([8, 12, 16, 20, 24, 32])),
+    ("processor_base_clock_ghz", _uniform(2.0, 4.0)),
+    ("processor_boost_clock_ghz", _uniform(4.0, 5.5)),
+
+    # Memory
+    ("ram_gb", _choice([8, 16, 32, 64], p=[0.2, 0.4, 0.3, 0.1])),
+    ("ram_type", _choice(["DDR4", "DDR5", "LPDDR4X", "LPDDR5"])),
+    ("ram_slots", _choice([2, 4])),
+    ("max_ram_gb", _choice([32, 64, 128])),
+
+    # Storage
+    ("storage_type", _choice(
+        ["NVMe SSD", "SATA SSD", "HDD", "NVMe SSD + HDD"],
+        p=[0.5, 0.2, 0.1, 0.2]
+    )),
+    ("storage_capacity_gb", _choice([256, 512, 1024, 2048], p=[0.2, 0.4, 0.3, 0.1])),
+    ("additional_storage_slots", _choice([0, 1, 2], p=[0.3, 0.5, 0.2])),
+
+    # Display
+    ("display_size_inches", _choice([13.3, 14.0, 15.6, 16.0, 17.3])),
+    ("display_resolution", _choice(
+        ["1920x1080", "2560x1440", "3840x2160"],
+        p=[0.6, 0.3, 0.1]
+    )),
+    ("display_type", _choice(["IPS", "OLED", "TN", "VA"], p=[0.5, 0.2, 0.2, 0.1])),
+    ("refresh_rate_hz", _choice([60, 90, 120, 144, 165, 240])),
+    ("touch_screen", _choice([True, False], p=[0.2, 0.8])),
+
+    # Graphics
+    ("gpu_type", _choice(["Integrated", "Dedicated", "Hybrid"], p=[0.3, 0.5, 0.2])),
+    ("gpu_brand", _choice(["NVIDIA", "AMD", "Intel", None], p=[0.4, 0.3, 0.2, 0.1])),
+    ("gpu_model", _choice(
+        ["RTX 4050", "RTX 4060", "RTX 4070", "RTX 4080", "RX 7600M", "RX 7700S", None]
+    )),
+    ("vram_gb", _choice([0, 4, 6, 8, 12, 16])),
+
+    # Physical
+    ("weight_kg", _uniform(1.2, 3.5)),
+    ("thickness_mm", _uniform(15, 25)),
+    ("battery_whr", _choice([50, 60, 70, 80, 90, 99])),
+
+    # Connectivity
+    ("has_wifi_6", _choice([True, False], p=[0.8, 0.2])),
+    ("has_bluetooth", _choice([True, False], p=[0.9, 0.1])),
+    ("usb_c_ports", _choice([0, 1, 2, 3, 4])),
+    ("usb_a_ports", _choice([0, 1, 2, 3, 4])),
+    ("hdmi_ports", _choice([0, 1, 2])),
+]
+
+
+def preprocess_hardware_specs(
+    df: pd.DataFrame,
+    features: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Preprocess hardware specs for AI/ML processing.
     
@@ -176,63 +261,206 @@ def preprocess_hardware_specs(df: pd.DataFrame) -> pd.DataFrame:
     - gpu_score: Numeric GPU performance score
     - display_quality_score: Combined display quality metric
     - portability_score: Portability metric (higher = more portable)
+    - battery_score: Battery capacity score (0-1)
+    - connectivity_score: Port availability score (0-1)
     
     Args:
         df: Raw hardware specs DataFrame
+        features: Optional list of features needed downstream. Only the
+                 derived features in this list are built; if None, all are.
     
     Returns:
         pd.DataFrame: Preprocessed DataFrame with derived features
     """
     df = df.copy()
-    
-    # Import scoring functions
-    from .normalizer import (
-        create_gpu_score,
-        create_display_quality_score,
-        create_portability_score
+    derived = _derived_feature_names(features)
+
+    # Derived scores are computed column-wise; see create_*_score in
+    # normalizer.py for the equivalent per-value definitions
+    return _assign_derived_features(
+        df, ((name, DERIVED_FEATURES[name](df)) for name in derived)
     )
-    
-    # Create GPU score
-    df["gpu_score"] = df.apply(
-        lambda row: create_gpu_score(row.get("gpu_type", "Integrated"), 
-                                      row.get("vram_gb")),
-        axis=1
+
+
+async def preprocess_hardware_specs_async(
+    df: pd.DataFrame,
+    features: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Async variant of preprocess_hardware_specs for event-loop callers.
+
+    The derived scores are independent column computations, so each
+    builder runs in the default thread pool and they are awaited together.
+    The NumPy work releases the GIL, which lets large specs tables score
+    on several cores at once.
+
+    Args:
+        df: Raw hardware specs DataFrame
+        features: Optional list of features needed downstream (see
+                 preprocess_hardware_specs)
+
+    Returns:
+        pd.DataFrame: Preprocessed DataFrame with derived features
+    """
+    df = df.copy()
+    derived = _derived_feature_names(features)
+
+    # Builders only read df, so they can safely share it across threads
+    results = await asyncio.gather(
+        *(asyncio.to_thread(DERIVED_FEATURES[name], df) for name in derived)
     )
-    
-    # Create display quality score
-    df["display_quality_score"] = df.apply(
-        lambda row: create_display_quality_score(
-            row.get("display_resolution", "1920x1080"),
-            row.get("display_type", "IPS"),
-            row.get("refresh_rate_hz", 60)
-        ),
-        axis=1
+
+    return _assign_derived_features(df, zip(derived, results))
+
+
+def _assign_derived_features(
+    df: pd.DataFrame,
+    pairs: Iterable[Tuple[str, Optional[np.ndarray]]]
+) -> pd.DataFrame:
+    """Add computed (name, values) derived columns to df, skipping None."""
+    for name, values in pairs:
+        if values is not None:
+            df[name] = values
+    return df
+
+
+def _derived_feature_names(features: Optional[List[str]]) -> List[str]:
+    """Derived features to build for the requested features (all if None)."""
+    if features is None:
+        return list(DERIVED_FEATURES)
+    return [name for name in DERIVED_FEATURES if name in features]
+
+
+def build_feature_matrix(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Convert preprocessed hardware specs into a dense feature matrix.
+
+    Args:
+        df: Preprocessed hardware specs DataFrame
+
+    Returns:
+        Tuple containing:
+            - C-contiguous float32 array of shape (n_specs, n_features)
+            - Array of spec IDs aligned with the matrix rows
+            - Feature column names, in get_feature_columns() order
+    """
+    columns = [c for c in get_feature_columns() if c in df.columns]
+    features = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float32))
+
+    if "spec_id" in df.columns:
+        spec_ids = df["spec_id"].to_numpy(dtype=object)
+    else:
+        spec_ids = np.arange(len(df)).astype(str).astype(object)
+
+    return features, spec_ids, columns
+
+
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """Return df[name], or a Series filled with default if the column is missing."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+def _category_scores(values: pd.Series, score_fn: Callable[[Any], float], default: float) -> np.ndarray:
+    """
+    Score a categorical column by computing score_fn once per distinct value.
+
+    Values are factorized into small-int codes and the per-category scores
+    are gathered with np.take, so no per-row string lookups are needed.
+    Missing values (code -1) get the default score.
+    """
+    codes, uniques = pd.factorize(values)
+    lookup_table = np.array([score_fn(u) for u in uniques] + [default], dtype=np.float64)
+    return np.take(lookup_table, codes)
+
+
+def _resolution_pixels(resolution: Any) -> int:
+    """Parse a "WIDTHxHEIGHT" string into a pixel count, defaulting to FHD."""
+    try:
+        width, height = map(int, resolution.split('x'))
+        return width * height
+    except (ValueError, AttributeError):
+        return 1920 * 1080
+
+
+def _gpu_score(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized create_gpu_score over a specs DataFrame."""
+    base = _category_scores(
+        _column(df, "gpu_type", "Integrated"),
+        lambda gpu_type: GPU_TYPE_SCORES.get(gpu_type, 0.0),
+        default=0.0
     )
-    
-    # Create portability score
-    df["portability_score"] = df.apply(
-        lambda row: create_portability_score(
-            row.get("weight_kg"),
-            row.get("thickness_mm")
-        ),
-        axis=1
+    vram = pd.to_numeric(_column(df, "vram_gb", 0), errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+    return np.minimum(10.0, base + vram * 0.5)
+
+
+def _display_quality_score(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized create_display_quality_score over a specs DataFrame."""
+    # Resolutions are parsed once per distinct value, not per row
+    pixels = _category_scores(
+        _column(df, "display_resolution", "1920x1080"),
+        _resolution_pixels,
+        default=1920 * 1080
     )
-    
-    # Create battery score (normalized 0-1)
-    if "battery_whr" in df.columns:
-        df["battery_score"] = df["battery_whr"].clip(40, 100).map(
-            lambda x: (x - 40) / 60
-        )
-    
-    # Create connectivity score
-    if all(col in df.columns for col in ["usb_c_ports", "usb_a_ports", "hdmi_ports"]):
-        df["connectivity_score"] = (
-            df["usb_c_ports"] * 0.4 + 
-            df["usb_a_ports"] * 0.3 + 
-            df["hdmi_ports"] * 0.3
-        ).clip(0, 1)
-    
-    return df
+
+    resolution_score = np.select(
+        [pixels >= 3840 * 2160, pixels >= 2560 * 1440, pixels >= 1920 * 1080],
+        [4.0, 3.0, 2.0],
+        default=1.0
+    )
+
+    panel_score = _category_scores(
+        _column(df, "display_type", "IPS"),
+        lambda display_type: PANEL_TYPE_SCORES.get(str(display_type).upper(), 1.0),
+        default=1.0
+    )
+
+    refresh = pd.to_numeric(_column(df, "refresh_rate_hz", 60), errors="coerce").to_numpy(dtype=np.float64)
+    refresh_score = np.select([refresh >= 144, refresh >= 90], [3.0, 2.0], default=1.0)
+
+    return np.minimum(10.0, resolution_score + panel_score + refresh_score)
+
+
+def _portability_score(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized create_portability_score over a specs DataFrame."""
+    weight = pd.to_numeric(_column(df, "weight_kg", np.nan), errors="coerce")
+    thickness = pd.to_numeric(_column(df, "thickness_mm", np.nan), errors="coerce")
+
+    weight_score = ((4 - weight) / 3).clip(0, 1)
+    thickness_score = ((30 - thickness) / 20).clip(0, 1)
+
+    # Missing weight or thickness gets the default middle score
+    return ((weight_score + thickness_score) / 2).fillna(0.5).to_numpy(dtype=np.float64)
+
+
+def _battery_score(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """Battery score (normalized 0-1), or None without battery_whr."""
+    if "battery_whr" not in df.columns:
+        return None
+    battery_whr = df["battery_whr"].to_numpy(dtype=np.float64)
+    return (np.clip(battery_whr, 40, 100) - 40) / 60
+
+
+def _connectivity_score(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """Connectivity score from port counts, or None without port columns."""
+    if not all(col in df.columns for col in ["usb_c_ports", "usb_a_ports", "hdmi_ports"]):
+        return None
+    return (
+        df["usb_c_ports"] * 0.4 + 
+        df["usb_a_ports"] * 0.3 + 
+        df["hdmi_ports"] * 0.3
+    ).clip(0, 1).to_numpy()
+
+
+# Derived feature name -> builder computing it from a raw specs DataFrame
+DERIVED_FEATURES: Dict[str, Callable[[pd.DataFrame], Optional[np.ndarray]]] = {
+    "gpu_score": _gpu_score,
+    "display_quality_score": _display_quality_score,
+    "portability_score": _portability_score,
+    "battery_score": _battery_score,
+    "connectivity_score": _connectivity_score
+}
 
 
 def get_feature_columns() -> List[str]:
@@ -290,5 +518,5 @@ def get_numeric_columns() -> List[str]:
         List[str]: Numeric column names
     """
     base_features = get_feature_columns()
-    # Add spec_id for reference but it won't be normalized
-    return base_features
+    # Remaining numeric table columns that aren't used as model features
+    return base_features + ["ram_slots", "vram_gb", "spec_version"]
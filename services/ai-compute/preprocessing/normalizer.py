@@ -11,6 +11,9 @@ Formula: X_normalized = (X - X_min) / (X_max - X_min)
 3NF Compliance: Normalization parameters are stored separately from raw data.
 """
 
+import json
+import os
+import tempfile
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
@@ -26,17 +29,37 @@ class MinMaxNormalizer:
         feature_range (Tuple[float, float]): Target range for normalization
     """
     
-    def __init__(self, feature_range: Tuple[float, float] = (0, 1)):
+    def __init__(
+        self,
+        feature_range: Tuple[float, float] = (0, 1),
+        numeric_columns: Optional[List[str]] = None
+    ):
         """
         Initialize the MinMaxNormalizer.
         
         Args:
             feature_range: Target range for normalized values (default: (0, 1))
+            numeric_columns: Optional fixed list of numeric columns to use when
+                            fit is called without features, instead of
+                            inspecting the DataFrame dtypes
         """
         self.feature_range = feature_range
-        self.min_values: Dict[str, float] = {}
-        self.max_values: Dict[str, float] = {}
+        self._numeric_columns = list(numeric_columns) if numeric_columns is not None else None
+        # Fitted parameters: feature name -> position in the _mins/_maxes arrays
+        self._feature_index: Dict[str, int] = {}
+        self._mins = np.empty(0, dtype=np.float64)
+        self._maxes = np.empty(0, dtype=np.float64)
         self._is_fitted = False
+
+    @property
+    def min_values(self) -> Dict[str, float]:
+        """Minimum value for each fitted feature"""
+        return {f: float(self._mins[i]) for f, i in self._feature_index.items()}
+
+    @property
+    def max_values(self) -> Dict[str, float]:
+        """Maximum value for each fitted feature"""
+        return {f: float(self._maxes[i]) for f, i in self._feature_index.items()}
     
     def fit(self, df: pd.DataFrame, features: Optional[List[str]] = None) -> 'MinMaxNormalizer':
         """
@@ -45,7 +68,8 @@ class MinMaxNormalizer:
         Args:
             df: Input DataFrame with hardware specifications
             features: Optional list of feature names to normalize.
-                     If None, all numeric columns are used.
+                     If None, the configured numeric_columns present in df
+                     are used, or all numeric columns if none were given.
 
         Returns:
             self: Fitted normalizer instance
@@ -53,33 +77,10 @@ class MinMaxNormalizer:
         Raises:
             ValueError: If DataFrame is empty or contains non-numeric data
         """
-        if df.empty:
-            raise ValueError("Cannot fit on empty DataFrame")
-
-        # Select numeric columns if features not specified
-        if features is None:
-            features = df.select_dtypes(include=[np.number]).columns.tolist()
+        feats, X = self._fit_matrix(df, features)
 
-        # Validate features exist
-        missing_features = set(features) - set(df.columns)
-        if missing_features:
-            raise ValueError(f"Missing features: {missing_features}")
-
-        # Compute min and max for each feature
-        for feature in features:
-            if feature not in df.columns:
-                continue
-            
-            # Skip non-numeric columns
-            if not pd.api.types.is_numeric_dtype(df[feature]):
-                continue
-                
-            col_data = df[feature].dropna()
-            if len(col_data) == 0:
-                continue
-
-            self.min_values[feature] = float(col_data.min())
-            self.max_values[feature] = float(col_data.max())
+        # Compute min and max for all features in one reduction
+        self._update_params(feats, np.nanmin(X, axis=0), np.nanmax(X, axis=0))
 
         self._is_fitted = True
         return self
@@ -101,39 +102,56 @@ class MinMaxNormalizer:
         if not self._is_fitted:
             raise NotFittedError("Normalizer must be fitted before transform")
 
-        # Create a copy to avoid modifying original data
-        df_normalized = df.copy()
-
         if features is None:
-            features = list(self.min_values.keys())
+            features = list(self._feature_index)
+
+        # Fitted numeric features present in the DataFrame
+        feats = [
+            f for f in features
+            if f in df.columns
+            and f in self._feature_index
+            and pd.api.types.is_numeric_dtype(df[f])
+        ]
+        if not feats:
+            return df.copy()
+
+        idx = self._param_index(feats)
+        mn = self._mins[idx]
+        mx = self._maxes[idx]
+
+        X = df[feats].to_numpy(dtype=np.float64, copy=False)
+        Y = self._scale(X, mn, mx)
+
+        # Build the output without mutating the original data
+        return df.assign(**{f: Y[:, i] for i, f in enumerate(feats)})
+    
+    def transform_array(self, X: np.ndarray, features: List[str]) -> np.ndarray:
+        """
+        Scale a 2D feature matrix using the fitted parameters.
 
-        min_range, max_range = self.feature_range
+        Args:
+            X: Array of shape (n_samples, n_features)
+            features: Feature name of each column of X
 
-        for feature in features:
-            if feature not in df_normalized.columns:
-                continue
+        Returns:
+            np.ndarray: Scaled copy of X (same dtype); columns without
+                fitted parameters are left unchanged
 
-            if feature not in self.min_values or feature not in self.max_values:
-                continue
+        Raises:
+            NotFittedError: If normalizer hasn't been fitted yet
+        """
+        if not self._is_fitted:
+            raise NotFittedError("Normalizer must be fitted before transform")
 
-            # Skip non-numeric columns
-            if not pd.api.types.is_numeric_dtype(df_normalized[feature]):
-                continue
+        cols = [i for i, f in enumerate(features) if f in self._feature_index]
 
-            min_val = self.min_values[feature]
-            max_val = self.max_values[feature]
+        Y = np.array(X, copy=True)
+        if cols:
+            idx = self._param_index([features[i] for i in cols])
+            Y[:, cols] = self._scale(X[:, cols], self._mins[idx], self._maxes[idx])
 
-            # Handle constant features (max == min)
-            if max_val == min_val:
-                df_normalized[feature] = (min_range + max_range) / 2
-            else:
-                # Apply Min-Max normalization formula
-                df_normalized[feature] = (
-                    (df_normalized[feature].astype(float) - min_val) / (max_val - min_val)
-                ) * (max_range - min_range) + min_range
+        return Y
 
-        return df_normalized
-    
     def fit_transform(
         self, 
         df: pd.DataFrame, 
@@ -151,18 +169,115 @@ class MinMaxNormalizer:
                 - Normalized DataFrame
                 - Dictionary with scaling parameters
         """
-        self.fit(df, features)
-        df_normalized = self.transform(df, features)
+        # Single extraction serves both the min/max reduction and the scaling
+        feats, X = self._fit_matrix(df, features)
+
+        mn = np.nanmin(X, axis=0)
+        mx = np.nanmax(X, axis=0)
+        self._update_params(feats, mn, mx)
+        self._is_fitted = True
+
+        Y = self._scale(X, mn, mx)
+        df_normalized = df.assign(**{f: Y[:, i] for i, f in enumerate(feats)})
         
         scaling_params = {
-            "min_values": self.min_values.copy(),
-            "max_values": self.max_values.copy(),
+            "min_values": self.min_values,
+            "max_values": self.max_values,
             "feature_range": self.feature_range,
-            "features_normalized": list(self.min_values.keys())
+            "features_normalized": list(self._feature_index)
         }
         
         return df_normalized, scaling_params
     
+    def _default_features(self, df: pd.DataFrame) -> List[str]:
+        """Features to fit when none are given explicitly."""
+        if self._numeric_columns is not None:
+            return [c for c in self._numeric_columns if c in df.columns]
+        return df.select_dtypes(include=[np.number]).columns.tolist()
+
+    def _fit_matrix(
+        self,
+        df: pd.DataFrame,
+        features: Optional[List[str]]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Validate fit inputs and extract the features to fit as a float array.
+
+        Non-numeric features and features with no non-null values are skipped.
+
+        Returns:
+            Tuple of (fitted feature names, float64 array of their values)
+
+        Raises:
+            ValueError: If DataFrame is empty or features are missing
+        """
+        if df.empty:
+            raise ValueError("Cannot fit on empty DataFrame")
+
+        # Select numeric columns if features not specified
+        if features is None:
+            features = self._default_features(df)
+
+        # Drop duplicate feature names, keeping first-seen order
+        features = list(dict.fromkeys(features))
+
+        # Validate features exist
+        missing_features = set(features) - set(df.columns)
+        if missing_features:
+            raise ValueError(f"Missing features: {missing_features}")
+
+        # Skip non-numeric columns
+        feats = [f for f in features if pd.api.types.is_numeric_dtype(df[f])]
+        X = df[feats].to_numpy(dtype=np.float64)
+
+        # Skip columns with no non-null values
+        has_data = ~np.isnan(X).all(axis=0)
+        feats = [f for f, keep in zip(feats, has_data) if keep]
+        return feats, X[:, has_data]
+
+    def _param_index(self, features: List[str]) -> np.ndarray:
+        """Positions of fitted features in the _mins/_maxes arrays."""
+        return np.array([self._feature_index[f] for f in features], dtype=np.intp)
+
+    def _update_params(self, features: List[str], mins: Any, maxes: Any) -> None:
+        """Store min/max values for features, adding any not fitted before."""
+        new_features = list(dict.fromkeys(f for f in features if f not in self._feature_index))
+        if new_features:
+            for f in new_features:
+                self._feature_index[f] = len(self._feature_index)
+            padding = np.empty(len(new_features), dtype=np.float64)
+            self._mins = np.concatenate([self._mins, padding])
+            self._maxes = np.concatenate([self._maxes, padding])
+
+        idx = self._param_index(features)
+        self._mins[idx] = np.asarray(mins, dtype=np.float64)
+        self._maxes[idx] = np.asarray(maxes, dtype=np.float64)
+
+    def _scale(self, X: np.ndarray, mn: np.ndarray, mx: np.ndarray) -> np.ndarray:
+        """
+        Apply the Min-Max formula column-wise to a 2D float array.
+
+        Args:
+            X: Array of shape (n_samples, n_features)
+            mn: Per-feature minimum values
+            mx: Per-feature maximum values
+
+        Returns:
+            np.ndarray: Scaled array of the same shape as X
+        """
+        min_range, max_range = self.feature_range
+
+        # Constant features (max == min) map to the middle of the range;
+        # selected with np.where instead of a per-feature branch
+        constant = mx == mn
+        rng = np.where(constant, 1.0, mx - mn)
+
+        return np.where(
+            constant,
+            (min_range + max_range) / 2,
+            (X - mn) / rng * (max_range - min_range) + min_range
+        )
+
     def inverse_transform(self, df: pd.DataFrame, features: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Reverse the normalization to get original values.
@@ -181,17 +296,18 @@ class MinMaxNormalizer:
         min_range, max_range = self.feature_range
         
         if features is None:
-            features = list(self.min_values.keys())
+            features = list(self._feature_index)
         
         for feature in features:
             if feature not in df_original.columns:
                 continue
             
-            if feature not in self.min_values or feature not in self.max_values:
+            if feature not in self._feature_index:
                 continue
             
-            min_val = self.min_values[feature]
-            max_val = self.max_values[feature]
+            i = self._feature_index[feature]
+            min_val = float(self._mins[i])
+            max_val = float(self._maxes[i])
             
             if max_val == min_val:
                 df_original[feature] = min_val
@@ -203,16 +319,28 @@ class MinMaxNormalizer:
         
         return df_original
     
-    def get_scaling_params(self) -> Dict[str, Any]:
+    def get_scaling_params(self, features: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get the scaling parameters for persistence.
+
+        Args:
+            features: Optional list of features to include (default: all fitted)
         
         Returns:
             Dict containing min_values, max_values, and feature_range
         """
+        if features is None:
+            return {
+                "min_values": self.min_values,
+                "max_values": self.max_values,
+                "feature_range": self.feature_range
+            }
+
+        fitted = [f for f in features if f in self._feature_index]
+        idx = self._param_index(fitted)
         return {
-            "min_values": self.min_values.copy(),
-            "max_values": self.max_values.copy(),
+            "min_values": dict(zip(fitted, self._mins[idx].tolist())),
+            "max_values": dict(zip(fitted, self._maxes[idx].tolist())),
             "feature_range": self.feature_range
         }
     
@@ -223,10 +351,68 @@ class MinMaxNormalizer:
         Args:
             params: Dictionary with min_values, max_values, and feature_range
         """
-        self.min_values = params.get("min_values", {})
-        self.max_values = params.get("max_values", {})
-        self.feature_range = params.get("feature_range", (0, 1))
-        self._is_fitted = bool(self.min_values)
+        min_values = params.get("min_values", {})
+        max_values = params.get("max_values", {})
+        features = [f for f in min_values if f in max_values]
+
+        self._feature_index = {}
+        self._mins = np.empty(0, dtype=np.float64)
+        self._maxes = np.empty(0, dtype=np.float64)
+        self._update_params(
+            features,
+            [min_values[f] for f in features],
+            [max_values[f] for f in features]
+        )
+
+        self.feature_range = tuple(params.get("feature_range", (0, 1)))
+        self._is_fitted = bool(self._feature_index)
+
+    def save(self, path: str) -> None:
+        """
+        Persist the scaling parameters to a JSON file.
+
+        The file is written to a temporary path in the same directory and
+        then renamed into place, so concurrent readers never see a partial file.
+
+        Args:
+            path: Destination file path
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.get_scaling_params(), f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        numeric_columns: Optional[List[str]] = None
+    ) -> 'MinMaxNormalizer':
+        """
+        Create a fitted normalizer from parameters saved with save().
+
+        Args:
+            path: JSON file written by save()
+            numeric_columns: Optional fixed numeric columns (see __init__)
+
+        Returns:
+            MinMaxNormalizer: Normalizer with the persisted parameters
+
+        Raises:
+            ValueError: If the file holds no scaling parameters
+        """
+        with open(path) as f:
+            params = json.load(f)
+
+        normalizer = cls(numeric_columns=numeric_columns)
+        normalizer.set_scaling_params(params)
+        if not normalizer._is_fitted:
+            raise ValueError(f"No scaling parameters in {path}")
+        return normalizer
 
 
 class NotFittedError(Exception):
@@ -269,6 +455,22 @@ HARDWARE_SPEC_FEATURES = [
 ]
 
 
+# Score lookup tables shared by the scalar scorers below and the
+# vectorized column builders in data_loader
+GPU_TYPE_SCORES: Dict[str, float] = {
+    "Integrated": 1.0,
+    "Hybrid": 3.0,
+    "Dedicated": 5.0
+}
+
+PANEL_TYPE_SCORES: Dict[str, float] = {
+    "OLED": 3.0,
+    "IPS": 2.0,
+    "VA": 1.5,
+    "TN": 1.0
+}
+
+
 def create_gpu_score(gpu_type: str, vram_gb: Optional[float]) -> float:
     """
     Create a numeric GPU score for normalization.
@@ -280,13 +482,7 @@ def create_gpu_score(gpu_type: str, vram_gb: Optional[float]) -> float:
     Returns:
         float: GPU score between 0-10
     """
-    type_scores = {
-        "Integrated": 1.0,
-        "Hybrid": 3.0,
-        "Dedicated": 5.0
-    }
-    
-    base_score = type_scores.get(gpu_type, 0)
+    base_score = GPU_TYPE_SCORES.get(gpu_type, 0)
     vram_score = vram_gb if vram_gb else 0
     
     return min(10.0, base_score + vram_score * 0.5)
@@ -326,13 +522,7 @@ def create_display_quality_score(
         resolution_score = 1.0
     
     # Panel type score (0-3)
-    type_scores = {
-        "OLED": 3.0,
-        "IPS": 2.0,
-        "VA": 1.5,
-        "TN": 1.0
-    }
-    panel_score = type_scores.get(display_type.upper(), 1.0)
+    panel_score = PANEL_TYPE_SCORES.get(display_type.upper(), 1.0)
     
     # Refresh rate score (0-3)
     if refresh_rate >= 144: